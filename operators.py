@@ -0,0 +1,862 @@
+import bpy
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # Numba is optional; the NumPy path is used without it
+    njit = None
+
+from .utils import (
+    append_vertex_groups,
+    clean_name_to_bmp,
+    clear_overlap_vertices,
+    overlap_vertices,
+    polygons_using_vertices,
+    redraw_areas,
+    refresh_overlap_label,
+    remap_vertex_group_weights,
+    remember_tex_assignment,
+    store_overlap_vertices,
+    tex_assignment_current,
+    tex_image_nodes,
+    tex_signature,
+    validate_active_object,
+    vertex_group_arrays,
+    weights_bmesh,
+    write_polygon_selection,
+)
+
+# ------------------------------------------------------------
+# L/R SWAP OPERATOR (Vertex Groups)
+# ------------------------------------------------------------
+def _mirror_lr(name):
+    """Name with its R/L side swapped, or None if it has neither"""
+    if " R " in name:
+        return name.replace(" R ", " L ")
+    if " L " in name:
+        return name.replace(" L ", " R ")
+    return None
+
+
+class OBJECT_OT_swap_rl_vertex_groups(bpy.types.Operator):
+    bl_idname = "object.swap_rl_vertex_groups"
+    bl_label = "Swap L/R Vertex Groups"
+    bl_description = "Swap between the (Left) or (Right) prefix. Useful for viewmodels"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def execute(self, context):
+        obj, error = validate_active_object(context, 'MESH')
+        if error:
+            self.report({'ERROR'}, error)
+            return {'CANCELLED'}
+
+        if not obj.vertex_groups:
+            self.report({'WARNING'}, "No vertex groups found on this mesh")
+            return {'CANCELLED'}
+
+        # Read each RNA name once; each vg.name access builds a new string
+        names = [vg.name for vg in obj.vertex_groups]
+        index_by_name = {name: i for i, name in enumerate(names)}
+        partner = {}
+        renames = []
+        for i, name in enumerate(names):
+            mirrored = _mirror_lr(name)
+            if mirrored is None:
+                continue
+            j = index_by_name.get(mirrored)
+            # Only a pair that mirrors onto each other can swap; "A R B L C" -> "A L B L C" doesn't map back
+            if j is not None and _mirror_lr(names[j]) == name:
+                # Renaming onto a name that still exists would give it a .001 suffix; swap the weights instead
+                partner[i] = j
+            else:
+                renames.append((i, mirrored))
+
+        if partner:
+            remap_vertex_group_weights(obj, partner)
+        for i, mirrored in renames:
+            obj.vertex_groups[i].name = mirrored
+        swapped_count = len(partner) + len(renames)
+
+        if swapped_count == 0:
+            self.report({'INFO'}, "No L/R vertex groups found to swap")
+        else:
+            self.report({'INFO'}, f"Swapped {swapped_count} vertex groups")
+        redraw_areas(context, {'PROPERTIES'})
+        return {'FINISHED'}
+
+
+# ------------------------------------------------------------
+# VALVE ↔ GEARBOX LIMB SWAP
+# ------------------------------------------------------------
+limb_suffix_map = {
+    "L Leg": "L Thigh",
+    "L Leg1": "L Calf",
+    "R Leg": "R Thigh",
+    "R Leg1": "R Calf",
+    "L Arm": "L Clavicle",
+    "L Arm1": "L UpperArm",
+    "L Arm2": "L Forearm",
+    "R Arm": "R Clavicle",
+    "R Arm1": "R UpperArm",
+    "R Arm2": "R Forearm",
+}
+reverse_suffix_map = {v: k for k, v in limb_suffix_map.items()}
+
+# Last character -> [(" " + suffix, replacement)], longest first so "L Leg1" is never shadowed by "L Leg"
+_BY_LAST_CHAR = {}
+for _suf, _mapped in sorted({**limb_suffix_map, **reverse_suffix_map}.items(), key=lambda kv: -len(kv[0])):
+    _BY_LAST_CHAR.setdefault(_suf[-1], []).append((" " + _suf, _mapped))
+del _suf, _mapped
+
+def _swap_by_suffix(name: str) -> str:
+    candidates = _BY_LAST_CHAR.get(name[-1:])
+    if not candidates:
+        return name
+    for needle, mapped in candidates:
+        if name.endswith(needle):
+            return f"{name[:-len(needle)]} {mapped}"
+    return name
+
+
+# ------------------------------------------------------------
+# PREFIX RENAMER
+# ------------------------------------------------------------
+def _replace_text(name: str, from_text: str, to_text: str):
+    """Replace every occurrence of from_text, or return None if there is none"""
+    if name.startswith(from_text):
+        # Common case: the text is a prefix such as "Bip01", so skip the containment scan
+        return to_text + name[len(from_text):].replace(from_text, to_text)
+    if from_text in name:
+        return name.replace(from_text, to_text)
+    return None
+
+
+class OBJECT_OT_rename_prefix(bpy.types.Operator):
+    bl_idname = "object.rename_prefix"
+    bl_label = "Rename Prefix"
+    bl_description = "Rename prefix of vertex groups or skeleton depending on selection"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def execute(self, context):
+        scene = context.scene
+        props = scene.gsmodelhelper_props
+        obj = context.active_object
+        
+        if not obj:
+            self.report({'ERROR'}, "No active object selected")
+            return {'CANCELLED'}
+
+        renamed_count = 0
+        
+        if obj.type == 'MESH':
+            from_text = props.vertex_from.strip()
+            to_text = props.vertex_to.strip()
+            
+            if not from_text:
+                self.report({'WARNING'}, "'From' field cannot be empty")
+                return {'CANCELLED'}
+            
+            if not obj.vertex_groups:
+                self.report({'WARNING'}, "No vertex groups found on this mesh")
+                return {'CANCELLED'}
+                
+            for vg in obj.vertex_groups:
+                new_name = _replace_text(vg.name, from_text, to_text)
+                if new_name is not None:
+                    vg.name = new_name
+                    renamed_count += 1
+                    
+        elif obj.type == 'ARMATURE':
+            from_text = props.skel_from.strip()
+            to_text = props.skel_to.strip()
+            
+            if not from_text:
+                self.report({'WARNING'}, "'From' field cannot be empty")
+                return {'CANCELLED'}
+            
+            if not obj.data.bones:
+                self.report({'WARNING'}, "No bones found in this armature")
+                return {'CANCELLED'}
+                
+            for bone in obj.data.bones:
+                new_name = _replace_text(bone.name, from_text, to_text)
+                if new_name is not None:
+                    bone.name = new_name
+                    renamed_count += 1
+        else:
+            self.report({'ERROR'}, "Active object must be a mesh or armature")
+            return {'CANCELLED'}
+
+        if renamed_count == 0:
+            self.report({'INFO'}, f"No items found containing '{from_text}'")
+        else:
+            self.report({'INFO'}, f"Renamed {renamed_count} items")
+        redraw_areas(context, {'PROPERTIES', 'OUTLINER'})
+        return {'FINISHED'}
+
+
+# ------------------------------------------------------------
+# COMBINED LIMB SWAP
+# ------------------------------------------------------------
+class OBJECT_OT_swap_limbs(bpy.types.Operator):
+    bl_idname = "object.swap_limbs"
+    bl_label = "Swap Limbs"
+    bl_description = "Swap Valve & Gearbox limb names for vertex groups or skeleton depending on selection"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def execute(self, context):
+        obj = context.active_object
+        if not obj:
+            self.report({'ERROR'}, "No active object selected")
+            return {'CANCELLED'}
+
+        swapped_count = 0
+        
+        if obj.type == 'MESH':
+            if not obj.vertex_groups:
+                self.report({'WARNING'}, "No vertex groups found on this mesh")
+                return {'CANCELLED'}
+                
+            for vg in obj.vertex_groups:
+                name = vg.name
+                new_name = _swap_by_suffix(name)
+                if new_name != name:
+                    vg.name = new_name
+                    swapped_count += 1
+        elif obj.type == 'ARMATURE':
+            if not obj.data.bones:
+                self.report({'WARNING'}, "No bones found in this armature")
+                return {'CANCELLED'}
+                
+            for bone in obj.data.bones:
+                name = bone.name
+                new_name = _swap_by_suffix(name)
+                if new_name != name:
+                    bone.name = new_name
+                    swapped_count += 1
+        else:
+            self.report({'ERROR'}, "Active object must be a mesh or armature")
+            return {'CANCELLED'}
+
+        if swapped_count == 0:
+            self.report({'INFO'}, "No Valve/Gearbox limb names found to swap")
+        else:
+            self.report({'INFO'}, f"Swapped {swapped_count} limb names")
+        redraw_areas(context, {'PROPERTIES', 'OUTLINER'})
+        return {'FINISHED'}
+
+
+# ------------------------------------------------------------
+# SWAP INPUT FIELDS
+# ------------------------------------------------------------
+class OBJECT_OT_swap_inputs(bpy.types.Operator):
+    bl_idname = "object.swap_inputs"
+    bl_label = "Swap Inputs"
+    bl_description = "Swap the 'From' and 'To' text fields"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def execute(self, context):
+        scene = context.scene
+        props = scene.gsmodelhelper_props
+        props.vertex_from, props.vertex_to = props.vertex_to, props.vertex_from
+        props.skel_from, props.skel_to = props.skel_to, props.skel_from
+        redraw_areas(context)
+        self.report({'INFO'}, "Swapped input fields")
+        return {'FINISHED'}
+
+
+# ------------------------------------------------------------
+# TEXTURE INTERPOLATION
+# ------------------------------------------------------------
+def _set_tex_interp(context, mode):
+    """Set interpolation on every image texture node of the selected meshes' materials.
+
+    Materials shared between objects are only visited once. Returns the number of nodes set.
+    """
+    processed_count = 0
+    seen = set()
+    for obj in context.selected_objects:
+        if obj.type != "MESH":
+            continue
+        for mat in obj.data.materials:
+            if not mat or mat in seen or not mat.node_tree:
+                continue
+            seen.add(mat)
+            for node in tex_image_nodes(mat):
+                node.interpolation = mode
+                processed_count += 1
+    return processed_count
+
+
+class OBJECT_OT_set_interp(bpy.types.Operator):
+    bl_idname = "object.set_interp"
+    bl_label = "Set Interpolation"
+    bl_description = "Set texture filtering (only on selected objects)"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    mode: bpy.props.EnumProperty(
+        name="Mode",
+        items=[("CLOSEST", "Closest", "Make textures pixelated (only on selected objects)"),
+               ("LINEAR", "Linear", "Make textures filtered (only on selected objects)")],
+        default="LINEAR",
+    )
+
+    @classmethod
+    def description(cls, context, properties):
+        return cls.bl_rna.properties["mode"].enum_items[properties.mode].description
+
+    def execute(self, context):
+        if not context.selected_objects:
+            self.report({'WARNING'}, "No objects selected")
+            return {'CANCELLED'}
+
+        # Node interpolation uses the title-cased names
+        node_mode = self.mode.title()
+        processed_count = _set_tex_interp(context, node_mode)
+        
+        props = context.scene.gsmodelhelper_props
+        props.interp_mode = self.mode
+        props.interp_is_closest = self.mode == "CLOSEST"
+        props.interp_is_linear = self.mode == "LINEAR"
+        redraw_areas(context, {'PROPERTIES', 'NODE_EDITOR'})
+        
+        if processed_count == 0:
+            self.report({'WARNING'}, "No texture image nodes found in selected objects")
+        else:
+            self.report({'INFO'}, f"Set {processed_count} textures to {node_mode} interpolation")
+        return {'FINISHED'}
+
+
+# ------------------------------------------------------------
+# VERTEX OVERLAP CHECKER (optimized)
+# ------------------------------------------------------------
+if njit is not None:
+    @njit(cache=True)
+    def _collect_pairs(vert_ids, offsets, groups):
+        """Emit a packed (g1 << 32) | g2 key and its vertex for every group pair of every vertex"""
+        total = 0
+        for v in range(vert_ids.shape[0]):
+            k = offsets[v + 1] - offsets[v]
+            total += k * (k - 1) // 2
+        pair_keys = np.empty(total, dtype=np.int64)
+        pair_verts = np.empty(total, dtype=np.int32)
+        out = 0
+        for v in range(vert_ids.shape[0]):
+            start = offsets[v]
+            end = offsets[v + 1]
+            # Insertion sort; a vertex rarely has more than 4 groups
+            for i in range(start + 1, end):
+                g = groups[i]
+                j = i - 1
+                while j >= start and groups[j] > g:
+                    groups[j + 1] = groups[j]
+                    j -= 1
+                groups[j + 1] = g
+            for i in range(start, end):
+                hi = np.int64(groups[i]) << 32
+                for j in range(i + 1, end):
+                    pair_keys[out] = hi | groups[j]
+                    pair_verts[out] = vert_ids[v]
+                    out += 1
+        return pair_keys, pair_verts
+else:
+    _collect_pairs = None
+
+
+def _overlap_pairs(vert_idx, group_idx):
+    """Map (g1_idx, g2_idx) to the ascending vertex indices weighted to both groups"""
+    # Sort by vertex, then group, so each vertex owns a contiguous sorted slice
+    order = np.lexsort((group_idx, vert_idx))
+    vert_idx = vert_idx[order]
+    group_idx = group_idx[order]
+    verts, starts, counts = np.unique(vert_idx, return_index=True, return_counts=True)
+    multi = counts > 1
+
+    if _collect_pairs is not None:
+        # CSR layout: groups[offsets[v]:offsets[v + 1]] belong to vert_ids[v]
+        offsets = np.zeros(np.count_nonzero(multi) + 1, dtype=np.int64)
+        np.cumsum(counts[multi], out=offsets[1:])
+        groups = group_idx[np.repeat(multi, counts)]
+        pair_keys, pair_verts = _collect_pairs(verts[multi], offsets, groups)
+    else:
+        # Vectorized: handle all vertices with the same number of groups k as one (n, k) matrix
+        counts = counts[multi]
+        starts = starts[multi]
+        verts = verts[multi]
+        key_parts = []
+        vert_parts = []
+        for k in np.unique(counts).tolist():
+            same_k = counts == k
+            gmat = group_idx[starts[same_k][:, None] + np.arange(k)].astype(np.int64)
+            ii, jj = np.triu_indices(k, 1)
+            # Same packed (g1 << 32) | g2 keys as the kernel
+            key_parts.append(((gmat[:, ii] << 32) | gmat[:, jj]).ravel())
+            vert_parts.append(np.repeat(verts[same_k], len(ii)))
+        pair_keys = np.concatenate(key_parts) if key_parts else np.empty(0, dtype=np.int64)
+        pair_verts = np.concatenate(vert_parts) if vert_parts else np.empty(0, dtype=np.int32)
+
+    # Sort by key, then vertex, so each pair's vertices come out ascending
+    order = np.lexsort((pair_verts, pair_keys))
+    pair_keys = pair_keys[order]
+    pair_verts = pair_verts[order]
+    keys, key_starts = np.unique(pair_keys, return_index=True)
+    return {
+        (key >> 32, key & 0xFFFFFFFF): vs
+        for key, vs in zip(keys.tolist(), np.split(pair_verts, key_starts[1:]))
+    }
+
+
+class OBJECT_OT_check_vertex_overlaps(bpy.types.Operator):
+    bl_idname = "object.check_vertex_overlaps"
+    bl_label = "Analyze Vertices"
+    bl_description = "Summarize overlapping vertex weights by group-pairs"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    # Vertices read per timer tick when run interactively
+    CHUNK_SIZE = 10000
+
+    _timer = None
+    _bm = None
+
+    def _validate(self, context):
+        obj, error = validate_active_object(context, 'MESH')
+        if error:
+            self.report({'ERROR'}, error)
+            return None
+
+        if not obj.vertex_groups:
+            self.report({'WARNING'}, "No vertex groups found on this mesh")
+            return None
+        return obj
+
+    def _populate(self, context, scene, names, vert_idx, group_idx):
+        """Fill the scene's overlap list from the flattened weight arrays; ``names`` are the vertex group names"""
+        overlaps_map = _overlap_pairs(vert_idx, group_idx)
+
+        # Reset right before filling: undo or a second run during the modal may have refilled the list
+        scene.vertex_overlap_list.clear()
+        scene.gsmodelhelper_props.overlap_page = 0
+        clear_overlap_vertices(scene)
+        store_overlap_vertices(scene, list(overlaps_map.values()))
+        for (g1, g2), unique_verts in overlaps_map.items():
+            # Vertices were visited in ascending order, so the lists are already sorted and unique
+            n1, n2 = sorted((names[g1], names[g2]))
+            item = scene.vertex_overlap_list.add()
+            item.groups = f"{n1} + {n2}"
+            item.count = len(unique_verts)
+            item.label = f"{item.groups} — {item.count} verts"
+
+        refresh_overlap_label(scene)
+        redraw_areas(context)
+
+        if len(scene.vertex_overlap_list) == 0:
+            self.report({'INFO'}, "No overlapping vertex weights found")
+        else:
+            self.report({'INFO'}, f"Found {len(scene.vertex_overlap_list)} overlap pairs")
+
+    def execute(self, context):
+        obj = self._validate(context)
+        if obj is None:
+            return {'CANCELLED'}
+
+        # Show progress
+        wm = context.window_manager
+        wm.progress_begin(0, 100)
+        
+        try:
+            vert_idx, group_idx = vertex_group_arrays(obj, wm.progress_update)
+            self._populate(context, context.scene, [vg.name for vg in obj.vertex_groups], vert_idx, group_idx)
+        finally:
+            wm.progress_end()
+            
+        return {'FINISHED'}
+
+    def invoke(self, context, event):
+        # Read vertices in chunks from a timer so the UI stays responsive on dense meshes
+        obj = self._validate(context)
+        if obj is None:
+            return {'CANCELLED'}
+
+        self._obj_name = obj.name
+        # The user can switch scenes mid-run; results and the UI freeze belong to this one.
+        # Kept as a pointer and looked up again, so a deleted scene isn't touched through a stale reference.
+        self._scene_ptr = context.scene.as_pointer()
+        # Group indices in the snapshot refer to the groups as they are now, even if some are deleted mid-run
+        self._group_names = [vg.name for vg in obj.vertex_groups]
+        # Snapshot the weights once; chunks are read from this copy on each tick
+        self._bm = weights_bmesh(obj)
+        self._bm.verts.ensure_lookup_table()
+        self._total = len(self._bm.verts)
+        self._start = 0
+        self._deform_layer = self._bm.verts.layers.deform.active
+        self._vert_idx = []
+        self._group_idx = []
+
+        # Panels would otherwise redraw the half-built state on every timer tick
+        context.scene.gsmodelhelper_props.freeze_ui = True
+
+        wm = context.window_manager
+        wm.progress_begin(0, 100)
+        self._timer = wm.event_timer_add(0.05, window=context.window)
+        wm.modal_handler_add(self)
+        return {'RUNNING_MODAL'}
+
+    def modal(self, context, event):
+        if event.type == 'ESC':
+            self._finish(context)
+            self.report({'INFO'}, "Vertex analysis cancelled")
+            return {'CANCELLED'}
+
+        if event.type != 'TIMER':
+            return {'PASS_THROUGH'}
+
+        obj = context.active_object
+        if obj is None or obj.name != self._obj_name:
+            self._finish(context)
+            self.report({'WARNING'}, "Active object changed during analysis, run it again")
+            return {'CANCELLED'}
+
+        stop = min(self._start + self.CHUNK_SIZE, self._total)
+        if self._deform_layer is not None:
+            append_vertex_groups(
+                self._bm.verts[self._start:stop], self._deform_layer, self._start,
+                self._vert_idx, self._group_idx,
+            )
+        self._start = stop
+        context.window_manager.progress_update(stop / max(self._total, 1) * 100)
+
+        if stop < self._total:
+            return {'PASS_THROUGH'}
+
+        self._finish(context)
+        scene = self._scene()
+        if scene is None:
+            self.report({'WARNING'}, "Scene was removed during analysis")
+            return {'CANCELLED'}
+        self._populate(
+            context, scene, self._group_names,
+            np.array(self._vert_idx, dtype=np.int32),
+            np.array(self._group_idx, dtype=np.int32),
+        )
+        return {'FINISHED'}
+
+    def _scene(self):
+        return next((scene for scene in bpy.data.scenes if scene.as_pointer() == self._scene_ptr), None)
+
+    def cancel(self, context):
+        # Called by Blender when it drops the handler, e.g. on file load or window close
+        self._finish(context)
+
+    def _finish(self, context):
+        wm = context.window_manager
+        if self._timer is not None:
+            wm.event_timer_remove(self._timer)
+            self._timer = None
+        if self._bm is not None:
+            self._bm.free()
+            self._bm = None
+        wm.progress_end()
+        scene = self._scene()
+        if scene is not None:
+            scene.gsmodelhelper_props.freeze_ui = False
+        redraw_areas(context)
+
+
+class OBJECT_OT_overlap_select(bpy.types.Operator):
+    bl_idname = "object.overlap_select"
+    bl_label = "Select Overlaps"
+    bl_description = "Select overlap list items, or the faces they affect"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    mode: bpy.props.EnumProperty(
+        name="Mode",
+        items=[("FACES", "Select Affected Faces", "Put mesh in Edit Mode and select all faces from chosen overlap entries"),
+               ("ALL", "Select All", "Select all overlapping items"),
+               ("NONE", "Deselect All", "Deselect all overlapping items")],
+        default="FACES",
+    )
+
+    @classmethod
+    def description(cls, context, properties):
+        return cls.bl_rna.properties["mode"].enum_items[properties.mode].description
+
+    def execute(self, context):
+        if self.mode == "FACES":
+            return self._select_faces(context)
+
+        scene = context.scene
+        select = self.mode == "ALL"
+        # foreach_set skips the per-item update callback; refresh the label once instead
+        scene.vertex_overlap_list.foreach_set("selected", [select] * len(scene.vertex_overlap_list))
+        refresh_overlap_label(scene)
+        redraw_areas(context)
+        if select:
+            self.report({'INFO'}, f"Selected all {len(scene.vertex_overlap_list)} overlap items")
+        else:
+            self.report({'INFO'}, "Deselected all overlap items")
+        return {'FINISHED'}
+
+    def _select_faces(self, context):
+        obj, error = validate_active_object(context, 'MESH')
+        if error:
+            self.report({'ERROR'}, error)
+            return {'CANCELLED'}
+
+        scene = context.scene
+        overlap_list = scene.vertex_overlap_list
+
+        if not overlap_list:
+            self.report({'WARNING'}, "No overlaps found. Run 'Check Vertex Overlaps' first")
+            return {'CANCELLED'}
+
+        flags = np.zeros(len(overlap_list), dtype=bool)
+        overlap_list.foreach_get("selected", flags)
+        rows = np.flatnonzero(flags).tolist()
+        selected_count = len(rows)
+
+        if selected_count == 0:
+            self.report({'WARNING'}, "No overlap items selected. Check the boxes next to the items you want to select")
+            return {'CANCELLED'}
+
+        if selected_count == 1:
+            # Common interactive case: use the row's verts directly, no accumulator
+            indices = overlap_vertices(scene, rows[0])
+        else:
+            # Collect vertices from all selected rows
+            chunks = [overlap_vertices(scene, row) for row in rows]
+            indices = None if any(c is None for c in chunks) else np.unique(np.concatenate(chunks))
+
+        if indices is None:
+            self.report({'WARNING'}, "Overlap data is out of date. Run 'Analyze Vertices' again")
+            return {'CANCELLED'}
+
+        if indices.size == 0:
+            self.report({'WARNING'}, "No vertices found in selected overlap items")
+            return {'CANCELLED'}
+
+        # Set active object and ensure it's selected
+        bpy.context.view_layer.objects.active = obj
+        obj.select_set(True)
+        
+        # Test faces against the mesh data in bulk, so flush any edit-mode changes first
+        if obj.mode != 'OBJECT':
+            bpy.ops.object.mode_set(mode='OBJECT')
+
+        me = obj.data
+        face_hit = polygons_using_vertices(me, indices)
+        selected_faces = int(np.count_nonzero(face_hit))
+
+        # Reveal and select in bulk on the mesh data, then enter Edit Mode once.
+        # Face mode must be set first: entering Edit Mode flushes the selection in the current
+        # select mode, and a vertex/edge flush would also select faces surrounded by hit faces.
+        write_polygon_selection(me, face_hit)
+        context.tool_settings.mesh_select_mode = (False, False, True)
+        bpy.ops.object.mode_set(mode='EDIT')
+
+        self.report({'INFO'}, f"Selected {selected_faces} faces from {len(indices)} vertices ({selected_count} overlap groups)")
+        redraw_areas(context)
+        return {'FINISHED'}
+
+
+# ------------------------------------------------------------
+# TEXTURING TOOLS
+# ------------------------------------------------------------
+class OBJECT_OT_assign_textures_to_materials(bpy.types.Operator):
+    bl_idname = "object.assign_textures_to_materials"
+    bl_label = "Image Texture to Object Material"
+    bl_description = "Assigns material names based on image texture node names, as well as applying the .bmp extension"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def execute(self, context):
+        if not context.selected_objects:
+            self.report({'WARNING'}, "No objects selected")
+            return {'CANCELLED'}
+
+        # Resolve each material's image once, however many selected objects share it
+        tex_by_mat = {}
+        for obj in context.selected_objects:
+            if obj.type != "MESH":
+                continue
+            for mat in obj.data.materials:
+                if not mat or not mat.node_tree or mat in tex_by_mat:
+                    continue
+                signature = tex_signature(mat)
+                # Unchanged since the last run and named after its image: nothing to do
+                if tex_assignment_current(mat, signature):
+                    tex_by_mat[mat] = (None, signature)
+                    continue
+                image_name = next((node.image.name for node in tex_image_nodes(mat) if node.image), None)
+                tex_by_mat[mat] = (image_name, signature)
+
+        assigned_count = 0
+        for mat, (image_name, signature) in tex_by_mat.items():
+            if image_name is None:
+                continue
+            old_name = mat.name
+            wanted_name = clean_name_to_bmp(image_name)
+            mat.name = wanted_name
+            if old_name != mat.name:
+                assigned_count += 1
+            remember_tex_assignment(mat, signature, wanted_name)
+
+        if assigned_count == 0:
+            self.report({'WARNING'}, "No texture image nodes found or materials already correctly named")
+        else:
+            self.report({'INFO'}, f"Assigned textures to {assigned_count} materials")
+        redraw_areas(context, {'PROPERTIES', 'OUTLINER', 'NODE_EDITOR'})
+        return {'FINISHED'}
+
+
+class OBJECT_OT_rename_materials_bmp(bpy.types.Operator):
+    bl_idname = "object.rename_materials_bmp"
+    bl_label = "Force .bmp Extension"
+    bl_description = "Renames all materials in selected objects to end with .bmp extension"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def execute(self, context):
+        if not context.selected_objects:
+            self.report({'WARNING'}, "No objects selected")
+            return {'CANCELLED'}
+
+        renamed_count = 0
+        for obj in context.selected_objects:
+            if obj.type != "MESH":
+                continue
+            for mat in obj.data.materials:
+                if mat:
+                    old_name = mat.name
+                    mat.name = clean_name_to_bmp(mat.name)
+                    if old_name != mat.name:
+                        renamed_count += 1
+
+        if renamed_count == 0:
+            self.report({'INFO'}, "All materials already have .bmp extension")
+        else:
+            self.report({'INFO'}, f"Renamed {renamed_count} materials to .bmp")
+        redraw_areas(context, {'PROPERTIES', 'OUTLINER', 'NODE_EDITOR'})
+        return {'FINISHED'}
+
+
+# ------------------------------------------------------------
+# VERTEX WEIGHT QUICK FIX 
+# ------------------------------------------------------------
+class OBJECT_OT_vertex_weight_quickfix(bpy.types.Operator):
+    bl_idname = "object.vertex_weight_quickfix"
+    bl_label = "Automatic Hard Weights"
+    bl_description = (
+        "Automatically normalize weights, then run Quantize and Limit Total "
+        "on all groups with parameter 1"
+    )
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def execute(self, context):
+        obj, error = validate_active_object(context, "MESH")
+        if error:
+            self.report({'ERROR'}, error)
+            return {'CANCELLED'}
+
+        if not obj.vertex_groups:
+            self.report({'WARNING'}, "No vertex groups found on this mesh")
+            return {'CANCELLED'}
+
+        bpy.context.view_layer.objects.active = obj
+        obj.select_set(True)
+
+        # Switch to Weight Paint mode
+        bpy.ops.object.mode_set(mode='WEIGHT_PAINT')
+
+        # Ensure Auto Normalize is on
+        context.tool_settings.use_auto_normalize = True
+
+        # FIXED: Use 'steps' parameter instead of 'factor'
+        bpy.ops.object.vertex_group_quantize(steps=1)
+
+        # Limit Total (keep 1 influence)
+        bpy.ops.object.vertex_group_limit_total(limit=1)
+
+        self.report({'INFO'}, "Applied Auto-Normalize, Quantize, and Limit Total (1)")
+        redraw_areas(context)
+        return {'FINISHED'}
+
+
+# ------------------------------------------------------------
+# REMOVE UNUSED VERTEX GROUPS 
+# ------------------------------------------------------------
+class OBJECT_OT_remove_unused_vertex_groups(bpy.types.Operator):
+    bl_idname = "object.remove_unused_vertex_groups"
+    bl_label = "Clean Unassigned Vertices"
+    bl_description = "Remove all empty/unused vertex groups from selected meshes"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def execute(self, context):
+        if not context.selected_objects:
+            self.report({'WARNING'}, "No objects selected")
+            return {'CANCELLED'}
+
+        removed_total = 0
+        
+        # Store original modes
+        original_active = context.view_layer.objects.active
+        original_modes = {}
+        for obj in context.selected_objects:
+            if obj.type == "MESH":
+                original_modes[obj] = obj.mode
+        
+        try:
+            # Switch all to OBJECT mode first
+            for obj in context.selected_objects:
+                if obj.type == "MESH" and obj.mode != 'OBJECT':
+                    bpy.context.view_layer.objects.active = obj
+                    bpy.ops.object.mode_set(mode='OBJECT')
+            
+            # Find unused groups on every mesh first; vertex group data doesn't need the object active
+            unused_by_obj = []
+            for obj in context.selected_objects:
+                if obj.type != "MESH":
+                    continue
+                
+                # Find unused vertex groups (groups with no weight data)
+                _, group_idx = vertex_group_arrays(obj)
+                group_used = np.zeros(len(obj.vertex_groups), dtype=bool)
+                # Weights live on the mesh, so a shared mesh can reference groups this object doesn't have
+                group_used[group_idx[group_idx < len(group_used)]] = True
+                unused_by_obj.append((obj, [vg for vg, used in zip(obj.vertex_groups, group_used.tolist()) if not used]))
+            
+            # Remove the unused groups
+            for obj, unused_groups in unused_by_obj:
+                for vg in unused_groups:
+                    obj.vertex_groups.remove(vg)
+                removed_total += len(unused_groups)
+            
+            # Restore original modes
+            for obj, mode in original_modes.items():
+                if obj.mode != mode:
+                    bpy.context.view_layer.objects.active = obj
+                    bpy.ops.object.mode_set(mode=mode)
+            context.view_layer.objects.active = original_active
+
+        except Exception as e:
+            self.report({'ERROR'}, f"Error removing vertex groups: {str(e)}")
+            return {'CANCELLED'}
+
+        if removed_total == 0:
+            self.report({'INFO'}, "No unused vertex groups found")
+        else:
+            self.report({'INFO'}, f"Removed {removed_total} unused vertex groups from {len(context.selected_objects)} object(s)")
+        redraw_areas(context, {'PROPERTIES'})
+        return {'FINISHED'}
+
+
+classes = (
+    OBJECT_OT_swap_rl_vertex_groups,
+    OBJECT_OT_rename_prefix,
+    OBJECT_OT_swap_inputs,
+    OBJECT_OT_swap_limbs,
+    OBJECT_OT_set_interp,
+    OBJECT_OT_check_vertex_overlaps,
+    OBJECT_OT_overlap_select,
+    OBJECT_OT_vertex_weight_quickfix,
+    OBJECT_OT_remove_unused_vertex_groups,
+    OBJECT_OT_assign_textures_to_materials,
+    OBJECT_OT_rename_materials_bmp,
+)
@@ -0,0 +1,64 @@
+import bpy
+
+from .utils import refresh_overlap_label
+
+# ------------------------------------------------------------
+# PROPERTIES
+# ------------------------------------------------------------
+class GSModelHelper(bpy.types.PropertyGroup):
+    vertex_from: bpy.props.StringProperty(
+        name="From",
+        default="Bip01",
+        description="Text to replace in vertex group names"
+    )
+    vertex_to: bpy.props.StringProperty(
+        name="To",
+        default="Hands biped",
+        description="Replacement text for vertex group names"
+    )
+    skel_from: bpy.props.StringProperty(
+        name="From",
+        default="Bip01",
+        description="Text to replace in bone names"
+    )
+    skel_to: bpy.props.StringProperty(
+        name="To",
+        default="Hands biped",
+        description="Replacement text for bone names"
+    )
+    interp_mode: bpy.props.EnumProperty(
+        name="Interpolation Mode",
+        items=[("CLOSEST", "Closest", "Pixelated texture filtering"), 
+               ("LINEAR", "Linear", "Smooth texture filtering")],
+        default="LINEAR",
+    )
+    # Mirrors of interp_mode so the panel's toggle buttons read a flag instead of comparing strings
+    interp_is_closest: bpy.props.BoolProperty(default=False)
+    interp_is_linear: bpy.props.BoolProperty(default=True)
+    # Cached "Selected: n/m" text for the overlap panel, refreshed when the list changes
+    selected_label: bpy.props.StringProperty()
+    overlap_page: bpy.props.IntProperty(
+        name="Page",
+        min=0,
+        default=0,
+        description="Page of the overlap list to show"
+    )
+    # Set by long-running operators so panels skip drawing until they finish
+    freeze_ui: bpy.props.BoolProperty(default=False)
+
+
+class VertexOverlapItem(bpy.types.PropertyGroup):
+    groups: bpy.props.StringProperty()
+    count: bpy.props.IntProperty()
+    # Row text for the UI list, formatted once when the item is created
+    label: bpy.props.StringProperty()
+    selected: bpy.props.BoolProperty(
+        default=False,
+        update=lambda self, context: refresh_overlap_label(self.id_data)
+    )
+
+
+classes = (
+    GSModelHelper,
+    VertexOverlapItem,
+)
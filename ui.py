@@ -0,0 +1,244 @@
+import bpy
+
+# ------------------------------------------------------------
+# ICONS
+# ------------------------------------------------------------
+# Icon name -> enum value, resolved once in register() so draw() passes plain ints
+_ICON_NAMES = (
+    "OUTLINER_OB_ARMATURE",
+    "PLAY",
+    "ARROW_LEFTRIGHT",
+    "TOOL_SETTINGS",
+    "AREA_SWAP",
+    "GROUP_VERTEX",
+    "MOD_VERTEX_WEIGHT",
+    "X",
+    "MESH_DATA",
+    "VIEWZOOM",
+    "RESTRICT_SELECT_OFF",
+    "MATERIAL_DATA",
+    "TEXTURE",
+    "NODE_TEXTURE",
+    "FILE_TEXT",
+)
+_ICON = {}
+
+def _resolve_icons():
+    enum_items = bpy.types.UILayout.bl_rna.functions["label"].parameters["icon"].enum_items
+    _ICON.update((name, enum_items[name].value) for name in _ICON_NAMES)
+
+
+# ------------------------------------------------------------
+# VERTEX OVERLAP LIST
+# ------------------------------------------------------------
+class VERTEXOVERLAP_UL_list(bpy.types.UIList):
+    # Rows shown per page; keeps draw work bounded on messy imports with many overlaps
+    PAGE_SIZE = 500
+
+    def filter_items(self, context, data, propname):
+        items = getattr(data, propname)
+        helper = bpy.types.UI_UL_list
+        # Overriding filter_items disables the built-in name filter and sort, so apply them here
+        if self.filter_name:
+            flt_flags = helper.filter_items_by_name(self.filter_name, self.bitflag_filter_item, items, "groups")
+        else:
+            flt_flags = [self.bitflag_filter_item] * len(items)
+        flt_neworder = helper.sort_items_by_name(items, "groups") if self.use_filter_sort_alpha else []
+
+        # Blender applies invert and reverse sort afterwards; page over the rows it will actually show
+        shown = [i for i, flag in enumerate(flt_flags) if bool(flag) != self.use_filter_invert]
+        if flt_neworder:
+            shown.sort(key=flt_neworder.__getitem__)
+        if self.use_filter_sort_reverse:
+            shown.reverse()
+        last_page = max(0, len(shown) - 1) // self.PAGE_SIZE
+        page = min(context.scene.gsmodelhelper_props.overlap_page, last_page)
+        page_rows = set(shown[page * self.PAGE_SIZE:(page + 1) * self.PAGE_SIZE])
+        flt_flags = [
+            self.bitflag_filter_item if (i in page_rows) != self.use_filter_invert else 0
+            for i in range(len(items))
+        ]
+        return flt_flags, flt_neworder
+
+    def draw_item(self, context, layout, data, item, icon, active_data, active_propname, index):
+        row = layout.row(align=True)
+        row.prop(item, "selected", text="")
+        row.label(text=item.label)
+
+
+# ------------------------------------------------------------
+# PANELS
+# ------------------------------------------------------------
+# Sidebar narrower than this is collapsed; nothing in it would be readable
+MIN_REGION_WIDTH = 40
+
+def _skip_draw(layout, context):
+    """True if a panel should not draw its contents (collapsed sidebar or frozen UI)"""
+    if context.region.width < MIN_REGION_WIDTH:
+        return True
+    if context.scene.gsmodelhelper_props.freeze_ui:
+        layout.label(text="UI frozen during batch op")
+        return True
+    return False
+
+class VIEW3D_PT_gs_model_helper_bootstrap(bpy.types.Panel):
+    """Placeholder that keeps the sidebar tab visible until the real panels are registered"""
+    bl_label = "GS Model Helper"
+    bl_idname = "VIEW3D_PT_gs_model_helper_bootstrap"
+    bl_space_type = "VIEW_3D"
+    bl_region_type = "UI"
+    bl_category = "GS Model Helper"
+
+    def draw(self, context):
+        self.layout.label(text="Loading…")
+        # Classes can't safely be (un)registered while a region is drawing
+        if not bpy.app.timers.is_registered(_register_ui_classes):
+            bpy.app.timers.register(_register_ui_classes)
+
+
+class VIEW3D_PT_gs_model_helper(bpy.types.Panel):
+    bl_label = "Prefixes & Limbs Tools"
+    bl_idname = "VIEW3D_PT_gs_model_helper"
+    bl_space_type = "VIEW_3D"
+    bl_region_type = "UI"
+    bl_category = "GS Model Helper"
+
+    def draw(self, context):
+        layout = self.layout
+        if _skip_draw(layout, context):
+            return
+        scene = context.scene
+        props = scene.gsmodelhelper_props
+
+        layout.label(text="Prefix Renamer", icon_value=_ICON["OUTLINER_OB_ARMATURE"])
+        layout.prop(props, "vertex_from")
+        layout.prop(props, "vertex_to")
+        row = layout.row(align=True)
+        row.operator("object.rename_prefix", icon_value=_ICON["PLAY"])
+        row.operator("object.swap_inputs", icon_value=_ICON["ARROW_LEFTRIGHT"])
+
+        layout.separator()
+        layout.label(text="Swap Valve & Gearbox Limbs λ/⚙", icon_value=_ICON["TOOL_SETTINGS"])
+        layout.operator("object.swap_limbs", icon_value=_ICON["PLAY"])
+
+        layout.separator()
+        layout.label(text="Right and Left Prefix Swapper", icon_value=_ICON["AREA_SWAP"])
+        layout.operator("object.swap_rl_vertex_groups", text="Swap Prefix", icon_value=_ICON["PLAY"])
+
+
+class VIEW3D_PT_vertex_weights(bpy.types.Panel):
+    bl_label = "Vertex Weights/Groups Tools"
+    bl_idname = "VIEW3D_PT_vertex_weights"
+    bl_space_type = "VIEW_3D"
+    bl_region_type = "UI"
+    bl_category = "GS Model Helper"
+
+    def draw(self, context):
+        layout = self.layout
+        if _skip_draw(layout, context):
+            return
+        scene = context.scene
+        props = scene.gsmodelhelper_props
+
+        layout.label(text="Hard Weights & Cleanup", icon_value=_ICON["GROUP_VERTEX"])
+        layout.operator("object.vertex_weight_quickfix", icon_value=_ICON["MOD_VERTEX_WEIGHT"])
+        layout.operator("object.remove_unused_vertex_groups", icon_value=_ICON["X"])
+
+        layout.separator()
+        layout.label(text="Overlap Checker", icon_value=_ICON["MESH_DATA"])
+        layout.operator("object.check_vertex_overlaps", icon_value=_ICON["VIEWZOOM"])
+
+        has_overlaps = len(scene.vertex_overlap_list) > 0
+        if has_overlaps:
+            row = layout.row(align=True)
+            row.operator("object.overlap_select", text="All").mode = "ALL"
+            row.operator("object.overlap_select", text="None").mode = "NONE"
+
+        layout.template_list(
+            "VERTEXOVERLAP_UL_list", "",
+            scene, "vertex_overlap_list",
+            scene, "vertex_overlap_index",
+            rows=6
+        )
+        if len(scene.vertex_overlap_list) > VERTEXOVERLAP_UL_list.PAGE_SIZE:
+            layout.prop(props, "overlap_page")
+
+        if has_overlaps:
+            op = layout.operator("object.overlap_select", text="Select Affected Faces", icon_value=_ICON["RESTRICT_SELECT_OFF"])
+            op.mode = "FACES"
+            if props.selected_label:
+                layout.label(text=props.selected_label)
+
+
+class VIEW3D_PT_texturing(bpy.types.Panel):
+    bl_label = "Texturing Tools"
+    bl_idname = "VIEW3D_PT_texturing"
+    bl_space_type = "VIEW_3D"
+    bl_region_type = "UI"
+    bl_category = "GS Model Helper"
+
+    def draw(self, context):
+        layout = self.layout
+        if _skip_draw(layout, context):
+            return
+        scene = context.scene
+        props = scene.gsmodelhelper_props
+
+        layout.label(text="Texture Interpolation", icon_value=_ICON["MATERIAL_DATA"])
+        row = layout.row(align=True)
+        op = row.operator("object.set_interp", text="Closest", icon_value=_ICON["TEXTURE"], depress=props.interp_is_closest)
+        op.mode = "CLOSEST"
+        op = row.operator("object.set_interp", text="Linear", icon_value=_ICON["NODE_TEXTURE"], depress=props.interp_is_linear)
+        op.mode = "LINEAR"
+
+        layout.separator()
+        layout.label(text="Material Rename", icon_value=_ICON["FILE_TEXT"])
+        layout.operator("object.assign_textures_to_materials", icon_value=_ICON["PLAY"])
+        layout.operator("object.rename_materials_bmp", icon_value=_ICON["PLAY"])
+
+
+# ------------------------------------------------------------
+# REGISTER
+# ------------------------------------------------------------
+# Only needed once the sidebar tab is drawn; registered on demand by the bootstrap panel
+classes = (
+    VERTEXOVERLAP_UL_list,
+    VIEW3D_PT_gs_model_helper,
+    VIEW3D_PT_vertex_weights,
+    VIEW3D_PT_texturing,
+)
+
+_register_ui_classes_set, _unregister_ui_classes_set = bpy.utils.register_classes_factory(classes)
+
+_ui_registered = False
+
+def _register_ui_classes():
+    """Replace the bootstrap panel with the real UI classes (runs as a one-shot timer)"""
+    global _ui_registered
+    if _ui_registered:
+        return None
+
+    bpy.utils.unregister_class(VIEW3D_PT_gs_model_helper_bootstrap)
+    _register_ui_classes_set()
+    _ui_registered = True
+
+    for window in bpy.context.window_manager.windows:
+        for area in window.screen.areas:
+            if area.type == 'VIEW_3D':
+                area.tag_redraw()
+    return None
+
+def register():
+    _resolve_icons()
+    bpy.utils.register_class(VIEW3D_PT_gs_model_helper_bootstrap)
+
+def unregister():
+    global _ui_registered
+
+    if bpy.app.timers.is_registered(_register_ui_classes):
+        bpy.app.timers.unregister(_register_ui_classes)
+    if _ui_registered:
+        _unregister_ui_classes_set()
+        _ui_registered = False
+    else:
+        bpy.utils.unregister_class(VIEW3D_PT_gs_model_helper_bootstrap)
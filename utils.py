@@ -0,0 +1,385 @@
+import bpy
+from bpy.app.handlers import persistent
+import bmesh
+from collections import OrderedDict
+import numpy as np
+import re
+import time
+
+# ------------------------------------------------------------
+# UTILITY FUNCTIONS
+# ------------------------------------------------------------
+
+def ensure_edit_mode(obj):
+    """Context manager to ensure object is in edit mode and restore original mode"""
+    class EditModeManager:
+        def __init__(self, obj):
+            self.obj = obj
+            self.original_mode = obj.mode if obj else None
+            
+        def __enter__(self):
+            if self.obj and self.obj.mode != 'EDIT':
+                bpy.ops.object.mode_set(mode='EDIT')
+            return self
+            
+        def __exit__(self, exc_type, exc_val, exc_tb):
+            if self.obj and self.original_mode and self.original_mode != 'EDIT':
+                bpy.ops.object.mode_set(mode=self.original_mode)
+    
+    return EditModeManager(obj)
+
+def validate_active_object(context, required_type='MESH', require_selected=False):
+    """Enhanced validation with more options and better error messages"""
+    if require_selected and not context.selected_objects:
+        return None, "No objects selected"
+    
+    obj = context.active_object
+    if not obj:
+        return None, "No active object selected"
+    if obj.type != required_type:
+        return None, f"Active object must be a {required_type.lower()}, not {obj.type.lower()}"
+    return obj, None
+
+_NUM_SUFFIX_RE = re.compile(r"\.\d+$")
+
+def clean_name_to_bmp(name: str) -> str:
+    """Remove extensions and numeric suffixes, ensure .bmp at end"""
+    if not name.strip():
+        return "unnamed.bmp"
+    base = _NUM_SUFFIX_RE.sub("", name)  # remove numeric .001 etc
+    base = base.rsplit(".", 1)[0]       # remove extension
+    return (base or "unnamed") + ".bmp"
+
+def weights_bmesh(obj):
+    """Return a BMesh copy of the object's mesh for reading weights; the caller must free it.
+
+    In Edit Mode the live edit-mesh is copied, since obj.data is only synced on mode exit.
+    """
+    if obj.mode == 'EDIT':
+        return bmesh.from_edit_mesh(obj.data).copy()
+    bm = bmesh.new()
+    bm.from_mesh(obj.data)
+    return bm
+
+def append_vertex_groups(bm_verts, deform_layer, start, vert_idx, group_idx):
+    """Append the (vertex, group) index of every assignment with weight above zero to the lists.
+
+    ``bm_verts`` is a slice of BMesh verts beginning at vertex index ``start``.
+    """
+    # The deform layer is a C-level dict per vertex, much cheaper than MeshVertex.groups RNA
+    for vi, v in enumerate(bm_verts, start):
+        for group, weight in v[deform_layer].items():
+            if weight > 0.0:
+                vert_idx.append(vi)
+                group_idx.append(group)
+
+def vertex_group_arrays(obj, progress=None):
+    """Flatten vertex group assignments into parallel (vert_idx, group_idx) int32 arrays.
+
+    Only entries with a weight above zero are kept. ``progress`` is called with a
+    0-100 percentage at roughly 20 chunk boundaries.
+    """
+    vert_idx = []
+    group_idx = []
+    bm = weights_bmesh(obj)
+    try:
+        deform_layer = bm.verts.layers.deform.active
+        if deform_layer is not None:
+            bm.verts.ensure_lookup_table()
+            total = len(bm.verts)
+            step = max(1, total // 20)
+            for start in range(0, total, step):
+                if progress:
+                    progress(start / total * 100)
+                append_vertex_groups(bm.verts[start:start + step], deform_layer, start, vert_idx, group_idx)
+    finally:
+        bm.free()
+    return np.array(vert_idx, dtype=np.int32), np.array(group_idx, dtype=np.int32)
+
+def remap_vertex_group_weights(obj, group_map):
+    """Move each vertex's weight in group ``a`` to group ``group_map[a]`` in one BMesh pass.
+
+    Mapping two groups onto each other swaps their weights. Works on the live edit-mesh in Edit Mode.
+    """
+    me = obj.data
+    in_edit = obj.mode == 'EDIT'
+    if in_edit:
+        bm = bmesh.from_edit_mesh(me)
+    else:
+        bm = bmesh.new()
+        bm.from_mesh(me)
+    try:
+        deform_layer = bm.verts.layers.deform.active
+        if deform_layer is None:
+            return
+        for v in bm.verts:
+            dvert = v[deform_layer]
+            moved = [(group, weight) for group, weight in dvert.items() if group in group_map]
+            if not moved:
+                continue
+            # Remove first so a swapped pair doesn't overwrite the weight it still has to move
+            for group, _ in moved:
+                del dvert[group]
+            for group, weight in moved:
+                dvert[group_map[group]] = weight
+        if in_edit:
+            bmesh.update_edit_mesh(me)
+        else:
+            bm.to_mesh(me)
+            me.update()
+    finally:
+        if not in_edit:
+            bm.free()
+
+# (tag, length, dtype) -> foreach_get scratch array, least recently used first
+_BUF_CACHE = OrderedDict()
+_BUF_CACHE_SIZE = 4
+
+def _get_buf(tag, n, dtype):
+    """Reusable scratch array for a foreach_get target, so re-runs on the same mesh don't reallocate.
+
+    The contents are only valid until the next call with the same key; don't return it to callers.
+    """
+    key = (tag, n, np.dtype(dtype).str)
+    buf = _BUF_CACHE.pop(key, None)
+    if buf is None:
+        buf = np.empty(n, dtype=dtype)
+    _BUF_CACHE[key] = buf
+    if len(_BUF_CACHE) > _BUF_CACHE_SIZE:
+        _BUF_CACHE.popitem(last=False)
+    return buf
+
+def polygons_using_vertices(mesh, indices):
+    """Return a bool array flagging every polygon that uses any vertex in the given index array"""
+    loop_start = _get_buf("loop_start", len(mesh.polygons), np.int32)
+    mesh.polygons.foreach_get("loop_start", loop_start)
+    loop_verts = _get_buf("loop_verts", len(mesh.loops), np.int32)
+    mesh.loops.foreach_get("vertex_index", loop_verts)
+
+    if not len(loop_start):
+        return np.zeros(0, dtype=bool)
+    # Boolean lookup table instead of a hash/sort based membership test
+    vert_mask = np.zeros(len(mesh.vertices), dtype=bool)
+    vert_idx = np.asarray(indices, dtype=np.int32)
+    # Overlap results can be stale if the mesh was edited since the last analysis
+    vert_mask[vert_idx[vert_idx < len(vert_mask)]] = True
+    loop_hit = vert_mask[loop_verts]
+    # Polygon loops are stored contiguously, starting at loop_start
+    return np.logical_or.reduceat(loop_hit, loop_start)
+
+def write_polygon_selection(mesh, face_hit):
+    """Unhide all geometry and select exactly the flagged polygons with their verts and edges.
+
+    Writes mesh data directly, so the object must be in Object Mode.
+    """
+    loop_total = _get_buf("loop_total", len(mesh.polygons), np.int32)
+    mesh.polygons.foreach_get("loop_total", loop_total)
+    loop_verts = _get_buf("loop_verts", len(mesh.loops), np.int32)
+    mesh.loops.foreach_get("vertex_index", loop_verts)
+    loop_edges = _get_buf("loop_edges", len(mesh.loops), np.int32)
+    mesh.loops.foreach_get("edge_index", loop_edges)
+
+    loop_sel = np.repeat(face_hit, loop_total)
+    vert_sel = np.zeros(len(mesh.vertices), dtype=bool)
+    vert_sel[loop_verts[loop_sel]] = True
+    edge_sel = np.zeros(len(mesh.edges), dtype=bool)
+    edge_sel[loop_edges[loop_sel]] = True
+
+    for elems, sel in ((mesh.vertices, vert_sel), (mesh.edges, edge_sel), (mesh.polygons, face_hit)):
+        elems.foreach_set("hide", np.zeros(len(elems), dtype=bool))
+        elems.foreach_set("select", sel)
+
+# Material name -> names of its image texture nodes
+_TEX_NODE_CACHE = {}
+
+def tex_image_nodes(mat):
+    """Return the image texture nodes of a material's node tree, remembering which nodes they are"""
+    nodes = mat.node_tree.nodes
+    names = _TEX_NODE_CACHE.get(mat.name)
+    if names is not None:
+        cached = [nodes.get(name) for name in names]
+        # Renamed or deleted nodes invalidate the entry; added nodes are caught by the depsgraph handler
+        if all(node is not None and node.type == "TEX_IMAGE" for node in cached):
+            return cached
+    tex_nodes = [node for node in nodes if node.type == "TEX_IMAGE"]
+    _TEX_NODE_CACHE[mat.name] = [node.name for node in tex_nodes]
+    return tex_nodes
+
+# Material name (after renaming) -> (tex_signature(), wanted name) from the last texture assignment
+_TEX_ASSIGNED = {}
+
+def tex_signature(mat):
+    """Hash of the image texture nodes and images a material's texture assignment depends on"""
+    return hash(tuple((node.name, node.image.name if node.image else None) for node in tex_image_nodes(mat)))
+
+def tex_assignment_current(mat, signature):
+    """True if ``mat`` already has the name its unchanged image nodes give it.
+
+    A material that got a .001 suffix from a name collision is not current, so re-running can fix it.
+    """
+    entry = _TEX_ASSIGNED.get(mat.name)
+    return entry is not None and entry[0] == signature and entry[1] == mat.name
+
+def remember_tex_assignment(mat, signature, wanted_name):
+    _TEX_ASSIGNED[mat.name] = (signature, wanted_name)
+
+@persistent
+def _invalidate_tex_node_cache(scene, depsgraph):
+    for update in depsgraph.updates:
+        id_data = update.id
+        if isinstance(id_data, bpy.types.Material):
+            _TEX_NODE_CACHE.pop(id_data.name, None)
+        elif isinstance(id_data, bpy.types.NodeTree):
+            # Embedded material node trees don't expose their owner, so drop everything
+            _TEX_NODE_CACHE.clear()
+            return
+
+@persistent
+def _clear_caches(*args):
+    _TEX_NODE_CACHE.clear()
+    _TEX_ASSIGNED.clear()
+    _BUF_CACHE.clear()
+    _overlap_store.clear()
+
+@persistent
+def _reset_freeze_ui(*args):
+    # A file saved while a batch operator was running would otherwise load with its panels frozen
+    for scene in bpy.data.scenes:
+        scene.gsmodelhelper_props.freeze_ui = False
+
+def validate_operation_possible(context, operator_type):
+    """Check if operation can be performed with specific validation"""
+    if operator_type == 'vertex_groups':
+        obj = context.active_object
+        return obj and obj.type == 'MESH' and obj.vertex_groups
+    elif operator_type == 'armature':
+        obj = context.active_object
+        return obj and obj.type == 'ARMATURE' and obj.data.bones
+    return False
+
+# Minimum time between redraws requested outside a batch (~10 Hz)
+REDRAW_INTERVAL = 0.1
+
+class _BatchRedraw:
+    """Reentrant context manager that defers area redraws until the outermost block exits.
+
+    Outside a batch, redraws are throttled to one flush per REDRAW_INTERVAL; requests
+    arriving in between are coalesced and flushed by a timer.
+    """
+    depth = 0
+    # as_pointer() of the areas waiting for a redraw
+    pending = set()
+    deadline = 0.0
+
+    def __enter__(self):
+        _BatchRedraw.depth += 1
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        _BatchRedraw.depth -= 1
+        if _BatchRedraw.depth == 0:
+            _BatchRedraw.flush()
+
+    @classmethod
+    def request(cls, *areas):
+        """Redraw ``areas`` now, once the current batch ends, or when the throttle interval expires"""
+        cls.pending.update(area.as_pointer() for area in areas if area is not None)
+        if cls.depth or not cls.pending:
+            return
+        now = time.monotonic()
+        if now >= cls.deadline:
+            cls.flush()
+        elif not bpy.app.timers.is_registered(_flush_redraws):
+            bpy.app.timers.register(_flush_redraws, first_interval=cls.deadline - now)
+
+    @classmethod
+    def flush(cls):
+        pending, cls.pending = cls.pending, set()
+        cls.deadline = time.monotonic() + REDRAW_INTERVAL
+        if not pending:
+            return
+        # Look the areas up again: one requested earlier may have been freed by a screen change
+        for window in bpy.context.window_manager.windows:
+            for area in window.screen.areas:
+                if area.as_pointer() in pending:
+                    area.tag_redraw()
+
+def _flush_redraws():
+    _BatchRedraw.flush()
+    return None
+
+def redraw_areas(context, area_types=()):
+    """Redraw only context.area plus areas of the given types on the current screen"""
+    areas = [context.area]
+    if area_types and context.screen:
+        areas.extend(area for area in context.screen.areas if area.type in area_types and area != context.area)
+    _BatchRedraw.request(*areas)
+
+def gsmh_batch():
+    """Collapse the redraws of several GS Model Helper operators run from a script or macro into one.
+
+    Usage::
+
+        with gsmh_batch():
+            bpy.ops.object.assign_textures_to_materials()
+            bpy.ops.object.rename_materials_bmp()
+    """
+    return _BatchRedraw()
+
+
+# ------------------------------------------------------------
+# VERTEX OVERLAP STORE
+# ------------------------------------------------------------
+# Scene name -> (offsets, verts): the vertex indices of overlap list row i are
+# verts[offsets[i]:offsets[i + 1]]. Kept out of RNA so large overlaps don't bloat the collection.
+_overlap_store = {}
+
+def store_overlap_vertices(scene, vert_lists):
+    """Pack the per-row vertex index lists of the overlap list into the module store"""
+    offsets = np.zeros(len(vert_lists) + 1, dtype=np.int64)
+    np.cumsum([len(verts) for verts in vert_lists], out=offsets[1:])
+    verts = np.concatenate(vert_lists).astype(np.int32) if vert_lists else np.empty(0, dtype=np.int32)
+    _overlap_store[scene.name] = (offsets, verts)
+
+def clear_overlap_vertices(scene):
+    _overlap_store.pop(scene.name, None)
+
+def overlap_vertices(scene, index):
+    """Vertex indices of overlap list row ``index``, or None if the stored data doesn't match the list"""
+    entry = _overlap_store.get(scene.name)
+    if entry is None:
+        return None
+    offsets, verts = entry
+    overlap_list = scene.vertex_overlap_list
+    # Guard against the list having been restored by undo or loaded from a file
+    if len(offsets) != len(overlap_list) + 1 or offsets[index + 1] - offsets[index] != overlap_list[index].count:
+        return None
+    return verts[offsets[index]:offsets[index + 1]]
+
+def refresh_overlap_label(scene):
+    """Recompute the cached selection label shown under the overlap list"""
+    overlap_list = scene.vertex_overlap_list
+    flags = np.zeros(len(overlap_list), dtype=bool)
+    overlap_list.foreach_get("selected", flags)
+    selected_count = int(np.count_nonzero(flags))
+    scene.gsmodelhelper_props.selected_label = (
+        f"Selected: {selected_count}/{len(overlap_list)}" if selected_count else ""
+    )
+
+
+# ------------------------------------------------------------
+# REGISTER
+# ------------------------------------------------------------
+def register_handlers():
+    bpy.app.handlers.depsgraph_update_post.append(_invalidate_tex_node_cache)
+    bpy.app.handlers.load_post.append(_clear_caches)
+    bpy.app.handlers.load_post.append(_reset_freeze_ui)
+
+def unregister_handlers():
+    bpy.app.handlers.load_post.remove(_reset_freeze_ui)
+    bpy.app.handlers.load_post.remove(_clear_caches)
+    bpy.app.handlers.depsgraph_update_post.remove(_invalidate_tex_node_cache)
+    if bpy.app.timers.is_registered(_flush_redraws):
+        bpy.app.timers.unregister(_flush_redraws)
+    _BatchRedraw.pending.clear()
+    _clear_caches()